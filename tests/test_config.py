@@ -0,0 +1,54 @@
+# coding:utf-8
+#
+# test_config.py
+# Unscripted Fira
+#
+# Created by agent on 10/14/26.
+# Copyright © 2020 Marquis Kurt. All rights reserved.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+"""This test module tests the world configuration reader."""
+import os
+import toml
+from uvn_fira.core import config
+
+DUMMY_CONFIG = """[level]
+[level.config]
+name = "%s"
+check = ["collect_all_coins", "exit"]
+allowed_blocks = []
+
+[level.map]
+layout = \"\"\"%%%%%%%%%%
+%%P.E%%
+%%%%%%%%%%
+\"\"\"
+"""
+
+def test_config_load(tmpdir):
+    """Test that the configuration reader loads a level file."""
+    level = tmpdir.join("level0.toml")
+    level.write(DUMMY_CONFIG % ("Dummy"))
+    reader = config.CSWorldConfigReader(str(level))
+    assert reader.title == "Dummy" and reader.data.size() == (3, 5)
+
+def test_config_reload_changed(tmpdir):
+    """Test that the configuration reader picks up changes to a level file it already loaded."""
+    level = tmpdir.join("level0.toml")
+    level.write(DUMMY_CONFIG % ("Dummy"))
+    config.CSWorldConfigReader(str(level))
+    modified = os.stat(str(level)).st_mtime + 10
+    level.write(DUMMY_CONFIG % ("Dumbo"))
+    os.utime(str(level), (modified, modified))
+    assert config.CSWorldConfigReader(str(level)).title == "Dumbo"
+
+def test_config_load_crlf(tmpdir, monkeypatch):
+    """Test that the configuration reader loads a level file with Windows line endings."""
+    monkeypatch.setattr(config, "_toml", toml)
+    level = tmpdir.join("level0.toml")
+    level.write_binary((DUMMY_CONFIG % ("Dummy")).replace("\n", "\r\n").encode("utf-8"))
+    reader = config.CSWorldConfigReader(str(level))
+    assert reader.title == "Dummy" and reader.data.size() == (3, 5)
@@ -51,4 +51,14 @@ def test_data_grid_locate_player():
 def test_data_grid_locate_error():
     """Test that the data will return bad values if it cannot locate something in the grid."""
     grid = cr.CSWorldDataGenerator(DUMMY_DATA).to_grid()
-    assert grid.first("HORSE") == (-1, -1)
\ No newline at end of file
+    assert grid.first("HORSE") == (-1, -1)
+
+def test_data_grid_locate_first():
+    """Test that the grid returns the first instance of an item in row-major order."""
+    grid = cr.CSWorldDataGenerator("%%%%%\n%P..%\n%.%E%\n%%%%%\n").to_grid()
+    assert grid.first("COIN") == (1, 2)
+
+def test_data_grid_locate_last():
+    """Test that the grid returns the last instance of an item in row-major order."""
+    grid = cr.CSWorldDataGenerator("%%%%%\n%P..%\n%.%E%\n%%%%%\n").to_grid()
+    assert grid.last("COIN") == (2, 1)
@@ -0,0 +1,44 @@
+# coding:utf-8
+#
+# test_player.py
+# Unscripted Fira
+#
+# Created by agent on 10/14/26.
+# Copyright © 2020 Marquis Kurt. All rights reserved.
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+"""This test module tests the player and world APIs."""
+from uvn_fira import api, core
+
+DUMMY_DATA = """%%%%%
+%P.E%
+%%%%%
+"""
+
+def make_player():
+    """Create a player in the dummy world."""
+    world = api.CSWorld(from_data=core.CSWorldDataGenerator(DUMMY_DATA))
+    return api.CSPlayer(in_world=world)
+
+def test_player_move():
+    """Test that the player moves into open spaces."""
+    player = make_player().move("east")
+    assert player.location() == (1, 2)
+
+def test_player_move_blocked():
+    """Test that the player does not move into walls."""
+    player = make_player().move("north")
+    assert player.location() == (1, 1) and player.blocked()
+
+def test_player_collect():
+    """Test that the player collects the coin at its position."""
+    player = make_player().move("east").collect()
+    assert player.capacity() == 1
+
+def test_player_collect_nothing():
+    """Test that collecting where there is no coin, or collecting twice, does nothing."""
+    player = make_player().collect().move("east").collect().collect()
+    assert player.capacity() == 1
@@ -12,6 +12,7 @@
 #
 """This test module tests the capabilities of the virtual machine I/O modules"""
 import os
+import pickle
 from uvn_fira.core import vm
 
 def test_vm_write():
@@ -73,3 +74,93 @@ def test_vm_player_move():
     read = vm.CSNadiaVM("test.nvm", (0, 0))
     read.next()
     assert read.pos() == (0, 1)
+
+def test_vm_arrays():
+    """Test that the VM reader stores values in allocated arrays."""
+    wrt = vm.CSNadiaVMWriter("test.nvm")
+    wrt.alloc("inventory", 2)
+    wrt.set(5)
+    wrt.push("inventory", 1)
+    wrt.write()
+
+    read = vm.CSNadiaVM("test.nvm", (0, 0))
+
+    while read.has_more_instructions():
+        read.next()
+
+    assert read.get("inventory") == [None, "5"] and read.get("_stack") is None
+
+def test_vm_builder_separate():
+    """Test that VM writer builders don't share their instructions."""
+    first = vm.CSNadiaVMWriterBuilder("test.nvm")
+    second = vm.CSNadiaVMWriterBuilder("test.nvm")
+    first.add()
+    assert first.instructions == ["add\n"] and not second.instructions
+
+def test_vm_set_coordinates():
+    """Test that the VM reader keeps constants containing spaces, such as coordinates, intact."""
+    wrt = vm.CSNadiaVMWriter("test.nvm")
+    wrt.set((1, 2))
+    wrt.write()
+
+    read = vm.CSNadiaVM("test.nvm", (0, 0))
+    read.next()
+    assert read._stack == ["(1, 2)"]
+
+def test_vm_builder_undo_collect():
+    """Test that undoing a collect also removes the pop and push statements preceding it."""
+    wrt = vm.CSNadiaVMWriterBuilder("test.nvm")
+    wrt.move("east")
+    wrt.pop("world_coins", 0)
+    wrt.push("inventory", 0)
+    wrt.collect()
+    wrt.undo(ignore_collect=False)
+    assert wrt.instructions == ["move player east\n"]
+
+def test_vm_divide():
+    """Test that the VM reader divides the two topmost values on the stack as integers."""
+    wrt = vm.CSNadiaVMWriter("test.nvm")
+    wrt.set(2)
+    wrt.set(7)
+    wrt.div()
+    wrt.write()
+
+    read = vm.CSNadiaVM("test.nvm", (0, 0))
+
+    while read.has_more_instructions():
+        read.next()
+
+    assert read._stack == [3]
+
+def test_vm_pickle():
+    """Test that a VM reader can be pickled and resumed, as in a saved game."""
+    wrt = vm.CSNadiaVMWriter("test.nvm")
+    wrt.alloc("inventory", 1)
+    wrt.set(5)
+    wrt.push("inventory", 0)
+    wrt.write()
+
+    read = vm.CSNadiaVM("test.nvm", (0, 0))
+    read.next()
+    read = pickle.loads(pickle.dumps(read, 2))
+
+    while read.has_more_instructions():
+        read.next()
+
+    assert read.get("inventory") == ["5"]
+
+def test_vm_invalid_command():
+    """Test that every invalid command raises its own error when it is executed."""
+    with open("test.nvm", 'w') as file_obj:
+        file_obj.write("foo\nfoo\n")
+
+    read = vm.CSNadiaVM("test.nvm", (0, 0))
+    errors = []
+
+    while read.has_more_instructions():
+        try:
+            read.next()
+        except vm.CSNadiaVMCommandNotFoundError as error:
+            errors.append(error)
+
+    assert len(errors) == 2 and errors[0] is not errors[1]
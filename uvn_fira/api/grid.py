@@ -27,36 +27,8 @@ from ..core import CSGrid
 # created here. pdoc will automatically use the documentation based on class inheritance rules.
 
 class CSWorldGrid(CSGrid):      #pylint:disable=missing-class-docstring
+    __slots__ = ()
 
     def __init__(self, grid, filter=None):  #pylint:disable=redefined-builtin
         # type: (CSWorldGrid, list, Optional[Callable[[any], any]]) -> None
         CSGrid.__init__(self, grid, filter)
-
-    def __str__(self):
-        return CSGrid.__str__(self)
-
-    def __eq__(self, value):
-        return CSGrid.__eq__(self, value)
-
-    def __ne__(self, value):
-        return CSGrid.__ne__(self, value)
-
-    def shape(self):
-        # type: (CSWorldGrid) -> tuple[int, int]
-        return CSGrid.shape(self)
-
-    def as_list(self):
-        # type: (CSWorldGrid) -> list[any]
-        return CSGrid.as_list(self)
-
-    def first(self, of=""):
-        # type: (CSWorldGrid, str) -> any
-        return CSGrid.first(self, of)
-
-    def last(self, of=""):
-        # type: (CSWorldGrid, str) -> any
-        return CSGrid.last(self, of)
-
-    def element_at(self, row, column):
-        # type: (CSWorldGrid, int, int) -> any
-        return CSGrid.element_at(self, row, column)
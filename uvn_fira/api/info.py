@@ -18,6 +18,8 @@ from .world import CSWorld
 from ..core import CSWorldConfigReader
 from ..core import CSNadiaVMWriter
 
+_DEFAULT_CONFIG_PATH = path.join("core", "src", "minigame", "levels")
+
 def get_level_information(level, fn_path="", **kwargs):
     # type: (int, str, dict) -> tuple[CSPlayer, CSWorld]
     """Create a world and player based on a game level.
@@ -39,9 +41,7 @@ def get_level_information(level, fn_path="", **kwargs):
         info (tuple): A tuple containing the `minigame.api.player.CSPlayer` object and the
             `minigame.api.world.CSWorld` object
     """
-    conf = path.join(kwargs["config_file"], ("level%s.toml" % (level))) \
-        if "config_file" in kwargs \
-            else path.join("core", "src", "minigame", "levels", ("level%s.toml" % (level)))
+    conf = path.join(kwargs.get("config_file", _DEFAULT_CONFIG_PATH), ("level%s.toml" % (level)))
     w_info = CSWorldConfigReader(conf, **kwargs)
     writer = CSNadiaVMWriter(path.join(fn_path, "compiled", ("adv_lvl%s.nvm" % (level))))
     world = CSWorld(from_data=w_info.data)
@@ -21,17 +21,22 @@ The module contains a class that lets players control the behavior of their mini
 from .world import CSWorld
 from ..core import CSNadiaVMWriter
 
+_MOVE_TRANSFORMS = {
+    "north": (-1, 0),
+    "south": (1, 0),
+    "west": (0, -1),
+    "east": (0, 1)
+}
+
+_NEIGHBOR_OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
 class CSPlayer(object):
     """The base class for a player in the minigame world.
 
     The player object contains methods for manipulating the current player's
         position and inventory system.
     """
-    _position = (0, 0)
-    _inventory = []
-    _world = None
-    _world_coins = []
-    _vm = None
+    __slots__ = ("_position", "_inventory", "_world", "_coin_index", "_walls", "_vm")
 
     def __init__(self, in_world, **kwargs):
         # type: (CSPlayer, CSWorld, dict) -> None
@@ -52,19 +57,24 @@ class CSPlayer(object):
             raise TypeError("Expected a minigame world type but received %s instead."
                             % (type(in_world)))
         self._world = in_world
-        self._world_coins = self._world.coins().as_list()[:]
+        # The coins that are still in the world are tracked by their index in the original list,
+        # which is also the index used for the world coins array in the VM.
+        world_coins = self._world.coins().as_list()
+        self._coin_index = {coin: index for index, coin in enumerate(world_coins)}
+        self._walls = frozenset(self._world.walls().as_list())
 
         self._position = kwargs['at_position'] if "at_position" in kwargs else self._world.player()
         self._inventory = kwargs['with_inv'] if "with_inv" in kwargs else []
+        self._vm = None
 
         if "vm" in kwargs:
-            self._vm = kwargs["vm"]
-            self._vm.alloc("world_coins", len(self._world_coins))
-            self._vm.alloc("inventory", len(self._world_coins))
+            vm = self._vm = kwargs["vm"]
+            vm.alloc("world_coins", len(world_coins))
+            vm.alloc("inventory", len(world_coins))
 
-            for coin in self._world_coins:
-                self._vm.set(coin)
-                self._vm.push("world_coins", self._world_coins.index(coin))
+            for index, coin in enumerate(world_coins):
+                vm.set(coin)
+                vm.push("world_coins", index)
 
     def location(self):
         # type: (CSPlayer) -> tuple[int, int]
@@ -101,13 +111,8 @@ class CSPlayer(object):
             blocked (bool): True if any walls are near the player (1-block radius).
         """
         px, py = self._position #pylint:disable=invalid-name
-
-        positions = [(px-1, py), (px+1, py), (px, py-1), (px, py+1)]
-
-        for position in positions:
-            if position in self._world.walls().as_list():
-                return True
-        return False
+        walls = self._walls
+        return any((px + dx, py + dy) in walls for dx, dy in _NEIGHBOR_OFFSETS)
 
     def move(self, direction):
         # type: (CSPlayer, str) -> CSPlayer
@@ -122,21 +127,14 @@ class CSPlayer(object):
             player (CSPlayer): The Player that committed the move action. This is useful in cases
                 where chaining methods is preferred.
         """
-        transforms = {
-            "north": (-1, 0),
-            "south": (1, 0),
-            "west": (0, -1),
-            "east": (0, 1)
-        }
-
-        trans_x, trans_y = transforms.get(direction, "east")
+        trans_x, trans_y = _MOVE_TRANSFORMS.get(direction, _MOVE_TRANSFORMS["east"])
         curr_x, curr_y = self._position
         new_x, new_y = curr_x + trans_x, curr_y + trans_y
 
-        if (new_x, new_y) not in self._world.walls().as_list():
+        if (new_x, new_y) not in self._walls:
             self._position = new_x, new_y
 
-        if self._vm:
+        if self._vm is not None:
             self._vm.move(direction)
 
         return self
@@ -152,15 +150,18 @@ class CSPlayer(object):
             player (CSPlayer): The Player object that committed the collect action. This is useful
                 in cases where chaining methods is preferred.
         """
-        item_index = self._world_coins.index(self._position)
+        item_index = self._coin_index.pop(self._position, None)
+        if item_index is None:
+            return self
+
         self._inventory.append(self._position)
 
-        if self._vm:
-            self._vm.pop("world_coins", item_index)
-            self._vm.push("inventory", item_index)
-            self._vm.collect()
+        vm = self._vm
+        if vm is not None:
+            vm.pop("world_coins", item_index)
+            vm.push("inventory", item_index)
+            vm.collect()
 
-        self._world_coins[item_index] = None
         return self
 
     def exit(self):
@@ -169,6 +170,7 @@ class CSPlayer(object):
 
         If a VM is specified, the VM writer will also close the writer by writing to the VM file.
         """
-        if self._vm:
-            self._vm.exit()
-            self._vm.write()
+        vm = self._vm
+        if vm is not None:
+            vm.exit()
+            vm.write()
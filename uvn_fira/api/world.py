@@ -48,10 +48,7 @@ class CSWorld(object):
     The minigame world contains a matrix containing the elements used to generate that world,
     as well as any specific world properties like coins and exit locations.
     """
-    _dimensions = (0, 0)
-    _player_position = (0, 0)
-    _grid = CSWorldGrid([])
-    _vm_author = CSNadiaVMWriter("null.nvm")
+    __slots__ = ("_dimensions", "_player_position", "_grid", "_walls", "_coins", "_vm_author")
 
     def __init__(self, from_data, **kwargs):
         # type: (CSWorld, CSWorldDataGenerator, dict) -> None
@@ -64,10 +61,14 @@ class CSWorld(object):
 
         self._grid = from_data.to_grid()
         self._dimensions = from_data.size()
-        self._player_position = from_data.to_grid().first("PLAYER")
+        self._player_position = self._grid.first("PLAYER")
 
-        if "nvm" in kwargs:
-            self._vm_author = CSNadiaVMWriter(kwargs["nvm"])
+        # The world's layout doesn't change once it has been generated, so the wall and coin grids
+        # only need to be filtered once.
+        self._walls = CSWorldGrid(self._grid.grid, lambda a: a == "WALL")
+        self._coins = CSWorldGrid(self._grid.grid, lambda a: a == "COIN")
+
+        self._vm_author = CSNadiaVMWriter(kwargs["nvm"]) if "nvm" in kwargs else None
 
     def player(self):
         # type: (CSWorld) -> tuple[int, int]
@@ -94,7 +95,7 @@ class CSWorld(object):
         Returns:
             walls (minigame.api.grid.CSWorldGrid): Grid containing only the walls.
         """
-        return CSWorldGrid(self._grid.grid, lambda a: a == "WALL")
+        return self._walls
 
     def coins(self):
         # type: (CSWorld) -> CSWorldGrid
@@ -103,7 +104,7 @@ class CSWorld(object):
         Returns:
             coins (minigame.api.grid.CSWorldGrid): Grid containing only the coins.
         """
-        return CSWorldGrid(self._grid.grid, lambda a: a == "COIN")
+        return self._coins
 
     def exit(self):
         # type: (CSWorld) -> any
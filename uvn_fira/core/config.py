@@ -13,12 +13,74 @@
 """This submodule contains the configuration system for reading worlds."""
 
 import os
-import toml
+from collections import OrderedDict
 from .data import CSWorldDataGenerator
 
+# Prefer the faster, standards-compliant TOML parsers when they are available, falling back to the
+# toml package on older versions of Python.
+try:
+    import tomllib as _toml
+except ImportError:
+    try:
+        import tomli as _toml
+    except ImportError:
+        import toml as _toml
+
+_CONFIG_CACHE = OrderedDict()
+_CONFIG_CACHE_SIZE = 32
+
 class CSWorldConfigGenerateError(Exception):
     """Could not generate the world from the requested file or configuration."""
 
+def _parse_config(file_object):
+    # type: (any) -> dict
+    """Parse the configuration in a file object, whether it was opened in text or binary mode.
+
+    Arguments:
+        file_object: The file object containing the TOML configuration.
+
+    Returns:
+        config (dict): The parsed configuration.
+    """
+    contents = file_object.read()
+    if isinstance(contents, bytes):
+        contents = contents.decode("utf-8")
+
+    # Files opened in binary mode keep their Windows line endings, which the toml package doesn't
+    # handle in multiline strings such as the map layout.
+    return _toml.loads(contents.replace("\r\n", "\n"))
+
+def _load_cached_config(filepath):
+    # type: (str) -> dict
+    """Load a configuration file from disk, reusing the parsed configuration if the file hasn't
+        changed since it was last loaded.
+
+    A file is considered unchanged if its modification time, size, and inode are the same. Edits
+        that keep the file's size and happen within the file system's timestamp resolution can't
+        be detected.
+
+    Arguments:
+        filepath (str): The path to the configuration file to load.
+
+    Returns:
+        config (dict): The parsed configuration.
+    """
+    # Nanosecond timestamps aren't available on Python 2, where the float timestamp is used instead.
+    stat = os.stat(filepath)
+    signature = getattr(stat, "st_mtime_ns", stat.st_mtime), stat.st_size, stat.st_ino
+    cached = _CONFIG_CACHE.pop(filepath, None)
+
+    if cached is not None and cached[0] == signature:
+        config = cached[1]
+    else:
+        with open(filepath, 'rb') as file_object:
+            config = _parse_config(file_object)
+        if len(_CONFIG_CACHE) >= _CONFIG_CACHE_SIZE:
+            _CONFIG_CACHE.popitem(last=False)
+
+    _CONFIG_CACHE[filepath] = signature, config
+    return config
+
 class CSWorldConfigReader(object):
     """The world configuration reader.
 
@@ -33,13 +95,7 @@ class CSWorldConfigReader(object):
         data: A `CSWorldDataGenerator` containing the world fata from the generated map that
             can be used to generate a world.
     """
-
-    _world_str = """"""
-
-    title = ""
-    checks = []
-    allowed = []
-    data = CSWorldDataGenerator("")
+    __slots__ = ("title", "checks", "allowed", "data", "_world_str")
 
     def __init__(self, filepath="", **kwargs):
         # type: (CSWorldConfigReader, str, dict) -> None
@@ -61,6 +117,10 @@ class CSWorldConfigReader(object):
                 function to load the file object.
         """
         config = {}
+        self.title = ""
+        self.checks = []
+        self.allowed = []
+        self._world_str = """"""
 
         if not filepath and not kwargs:
             raise CSWorldConfigGenerateError("Cannot generate an empty configuration.")
@@ -68,7 +128,6 @@ class CSWorldConfigReader(object):
         if filepath:
 
             exists_fn = os.path.isfile
-            load_fn = lambda a: open(a, 'r')
 
             if "exists" in kwargs and callable(kwargs["exists"]):
                 exists_fn = kwargs["exists"]
@@ -76,11 +135,13 @@ class CSWorldConfigReader(object):
             if not exists_fn(filepath):
                 raise IOError("Cannot locate file %s" % (filepath))
 
+            # Files opened with a custom loader (such as Ren'Py's) may not exist on disk, so only
+            # files read with the built-in loader can be checked for changes and cached.
             if "load" in kwargs and callable(kwargs["load"]):
-                load_fn = kwargs["load"]
-
-            with load_fn(filepath) as file_object:
-                config = toml.load(file_object)
+                with kwargs["load"](filepath) as file_object:
+                    config = _parse_config(file_object)
+            else:
+                config = _load_cached_config(filepath)
 
             if "level" not in config:
                 raise CSWorldConfigGenerateError("Missing key 'level' in config.")
@@ -94,8 +155,8 @@ class CSWorldConfigReader(object):
             lvl_map = current_level["map"]
 
             self.title = lvl_config["name"]
-            self.checks = lvl_config["check"]
-            self.allowed = lvl_config["allowed_blocks"]
+            self.checks = list(lvl_config["check"])
+            self.allowed = list(lvl_config["allowed_blocks"])
             self._world_str = lvl_map["layout"]
 
         if "title" in kwargs:
@@ -12,8 +12,26 @@
 #
 """This submodule contains the world data generator code for the configuration system."""
 
+from typing import Optional, Callable
 from .grid import CSGrid
 
+_TERRAIN = {
+    "%": "WALL",
+    "P": "PLAYER",
+    "E": "EXIT",
+    ".": "COIN"
+}
+
+def _is_coin(tile):
+    # type: (str) -> bool
+    """Determine whether a tile is a coin."""
+    return tile == "COIN"
+
+def _is_wall(tile):
+    # type: (str) -> bool
+    """Determine whether a tile is a wall."""
+    return tile == "WALL"
+
 class CSWorldDataGenerateError(Exception):
     """Could not generate the world data."""
 
@@ -23,10 +41,7 @@ class CSWorldDataGenerator(object):
     The world data generator reads the given input string and returns a grid-like two-dimensional
         array for use with world manipulation or storage.
     """
-
-    _str = ""
-    _data = []
-    _dimensions = 0, 0
+    __slots__ = ("_str", "_data", "_dimensions", "_grids")
 
     def __init__(self, data=""):
         # type: (CSWorldDataGenerator, str) -> None
@@ -37,50 +52,14 @@ class CSWorldDataGenerator(object):
         """
         self._str = data
 
-        total_rows = total_columns = 0
-        current_column = 0
-        current_row = []
-        world_matrix = []
-        did_set_player = False
-        did_set_exit = False
-        player_position = 0, 0
-
-        world_map_terrain = {
-            "%": "WALL",
-            "P": "PLAYER",
-            "E": "EXIT",
-            ".": "COIN"
-        }
-
-        for line in data:
-            if line == "\n":
-                world_matrix.append(current_row[:])
-                current_column = 0
-                total_rows += 1
-                current_row = []
-            else:
-                current_tile = world_map_terrain.get(line, "AIR")
-                current_row.append(current_tile)
-
-                if current_tile == "EXIT":
-                    if did_set_exit:
-                        raise CSWorldDataGenerateError("Cannot instantiate more than one exit.")
-
-                if current_tile == "PLAYER":
-                    if did_set_player:
-                        raise CSWorldDataGenerateError("Cannot instantiate more than one player \
-                                                    at coordinates %s and %s."
-                                                       % (player_position,
-                                                          (total_rows, current_column)))
-
-                    self._player_position = len(world_matrix), current_column - 1
-
-                if total_rows == 0:
-                    total_columns += 1
-                current_column += 1
-
-        self._data = world_matrix
-        self._dimensions = total_rows, total_columns
+        # Only rows terminated by a newline are part of the map; the column count comes from the
+        # first line of the data, whether or not it is terminated.
+        lines = data.split("\n")
+        rows = lines[:-1]
+
+        self._data = [[_TERRAIN.get(tile, "AIR") for tile in row] for row in rows]
+        self._dimensions = len(rows), len(lines[0])
+        self._grids = {}
 
     def __str__(self):
         return ("Dimensions: %s\nMap\n=====\n" + self._str) % (self._dimensions)
@@ -101,7 +80,7 @@ class CSWorldDataGenerator(object):
         Returns:
             A world grid containing the world data.
         """
-        return CSGrid(self._data, grid_filter=None)
+        return self._grid("world", None)
 
     def coins(self):
         # type: (CSWorldDataGenerator) -> CSGrid
@@ -110,7 +89,7 @@ class CSWorldDataGenerator(object):
         Returns:
             grid (CSGrid): The world grid containing the coins.
         """
-        return CSGrid(self._data, grid_filter=lambda x: x == "COIN")
+        return self._grid("coins", _is_coin)
 
     def walls(self):
         # type: (CSWorldDataGenerator) -> CSGrid
@@ -119,4 +98,22 @@ class CSWorldDataGenerator(object):
         Returns:
             grid (CSGrid): The world grid containing the walls.
         """
-        return CSGrid(self._data, grid_filter=lambda x: x == "WALL")
+        return self._grid("walls", _is_wall)
+
+    def _grid(self, name, grid_filter):
+        # type: (CSWorldDataGenerator, str, Optional[Callable[[str], bool]]) -> CSGrid
+        """Get a grid of the world data, creating it the first time it is requested.
+
+        Since the world data doesn't change once parsed, each grid is only built once and shared
+            between calls.
+
+        Arguments:
+            name (str): The name of the grid to get.
+            grid_filter (callable): The filter to apply to the world data when creating the grid.
+
+        Returns:
+            grid (CSGrid): The world grid for the given name.
+        """
+        if name not in self._grids:
+            self._grids[name] = CSGrid(self._data, grid_filter=grid_filter)
+        return self._grids[name]
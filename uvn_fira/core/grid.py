@@ -22,10 +22,11 @@ class CSGrid(object):
 
     Attributes:
         grid (list): The two-dimensional array containing items at given positions,
-            organized by row and column.
+            organized by row and column. The grid should be treated as read-only once
+            constructed, since the locations of its items are indexed on first lookup.
 
     """
-    grid = []
+    __slots__ = ("grid", "_shape", "_index", "_coordinates")
 
     def __init__(self, grid, grid_filter=None):
         # type: (CSGrid, list, Optional[Callable[[any], any]]) -> None
@@ -46,12 +47,12 @@ class CSGrid(object):
         else:
             temp_grid = grid[:]
         self.grid = temp_grid
+        self._shape = len(temp_grid), len(temp_grid[0]) if temp_grid else 0
+        self._index = None
+        self._coordinates = None
 
     def __str__(self):
-        data = ""
-        for row in self.grid:
-            data += str(row).replace("[", "").replace("]", "").replace(",", "\t") + "\n"
-        return data
+        return "".join("\t ".join(map(repr, row)) + "\n" for row in self.grid)
 
     def __eq__(self, value):
         return isinstance(value, CSGrid) and self.grid == value.grid
@@ -66,9 +67,7 @@ class CSGrid(object):
         Returns:
             shape (tuple): A tuple containig the total rows and columns of this grid.
         """
-        rows = len(self.grid)
-        columns = len(self.grid[0])
-        return rows, columns
+        return self._shape
 
     def as_list(self):
         # type: (CSGrid) -> list[any]
@@ -80,15 +79,12 @@ class CSGrid(object):
 
         Returns:
             coordinates (list): A list of tuples containing the coordinates to valid items in the
-                grid.
+                grid. The coordinates are computed once, and a new list is returned on every call.
         """
-        coordinates = []
-        rows, columns = self.shape()
-        for row in range(rows):
-            for column in range(columns):
-                if self.grid[row][column] is not None:
-                    coordinates.append((row, column))
-        return coordinates
+        if self._coordinates is None:
+            self._coordinates = [(row, column) for row, items in enumerate(self.grid)
+                                 for column, item in enumerate(items) if item is not None]
+        return self._coordinates[:]
 
     def first(self, of=""):     #pylint:disable=invalid-name
         # type: (CSGrid, str) -> tuple[int, int]
@@ -101,14 +97,8 @@ class CSGrid(object):
             coords (tuple): A tuple containing the row and column coordinates of the first item. If
                 the item was not found, the tuple `-1, -1` is returned.
         """
-        coords = (-1, -1)
-
-        for row in range(len(self.grid) - 1):
-            for column in range(len(self.grid[0]) - 1):
-                if self.grid[row][column] == of:
-                    coords = row, column
-                    break
-        return coords
+        locations = self._locate(of)
+        return locations[0] if locations else (-1, -1)
 
     def last(self, of=""):      #pylint:disable=invalid-name
         # type: (CSGrid, str) -> tuple[int, int]
@@ -121,16 +111,30 @@ class CSGrid(object):
             coords (tuple): A tuple containing the row and column coordinates of the last item. If
                 the item was not found, the tuple `-1, -1` is returned.
         """
-        inverse = [row[::-1] for row in self.grid][::-1]
-        coords = -1, -1
+        locations = self._locate(of)
+        return locations[-1] if locations else (-1, -1)
+
+    def _locate(self, of):      #pylint:disable=invalid-name
+        # type: (CSGrid, str) -> list[tuple[int, int]]
+        """Get the coordinates of every instance of an item in the grid.
+
+        The grid is indexed by item the first time this is called, so that subsequent lookups
+            don't need to scan the grid again.
 
-        for row in range(len(inverse) - 1):
-            for column in range(len(self.grid[0]) - 1):
-                if inverse[row][column] == of:
-                    coords = row, column
-                    break
+        Arguments:
+            of (str): The item to look for in this grid.
 
-        return coords
+        Returns:
+            coordinates (list): A list of tuples containing the coordinates of the item, in
+                row-major order.
+        """
+        if self._index is None:
+            index = {}
+            for row, items in enumerate(self.grid):
+                for column, item in enumerate(items):
+                    index.setdefault(item, []).append((row, column))
+            self._index = index
+        return self._index.get(of, [])
 
     def element_at(self, row, column):
         # type: (CSGrid, int, int) -> Any
@@ -16,16 +16,8 @@
 The template files are generated when the game starts and are replaced if none are found.
 """
 
-def generate_template(filepath, for_level=0):
-    # type: (str, int) -> None
-    """Generate a template file using the Minigame APIs.
-
-    Arguments:
-        filepath (str): The path to where the template file will be written.
-        for_level (int): The corresponding level for the minigame. Defaults to 0.
-    """
-    template = """#
-# This script corresponds to the Advanced Mode script for Level %s in the minigame.
+_TEMPLATE = """#
+# This script corresponds to the Advanced Mode script for Level %(level)s in the minigame.
 # It is recommended to keep the appropriate template code to start. Remember that the goal is to
 # collect all coins and reach the exit.
 #
@@ -37,19 +29,28 @@ def generate_template(filepath, for_level=0):
 # If you want to use a third-party tool or framework instead of the official Fira API and want to
 # sideload in a virtual machine file, make sure "Force Python compiler" in Settings > Minigame is
 # disabled and that your tool compiles the NadiaVM file to your save directory like the following:
-# /path/to/RenPy/net.marquiskurt.unscripted/minigame/compiled/adv_lvl%s.nvm
+# /path/to/RenPy/net.marquiskurt.unscripted/minigame/compiled/adv_lvl%(level)s.nvm
 #
 
 # Import the level information APIs.
 from uvn_fira.api import get_level_information, CSPlayer, CSWorld
 
 # Get all of the information for this particular level.
-game_player, game_world = get_level_information(%s,
+game_player, game_world = get_level_information(%(level)s,
                                                 fn_path=renpy.config.savedir + "/minigame/",
                                                 exists=renpy.loadable,
                                                 load=renpy.exports.file)
 
 # WRITE CODE HERE
-""" % (for_level, for_level, for_level)
-    with open(filepath, 'w+') as file_obj:
-        file_obj.write(template)
+"""
+
+def generate_template(filepath, for_level=0):
+    # type: (str, int) -> None
+    """Generate a template file using the Minigame APIs.
+
+    Arguments:
+        filepath (str): The path to where the template file will be written.
+        for_level (int): The corresponding level for the minigame. Defaults to 0.
+    """
+    with open(filepath, 'w') as file_obj:
+        file_obj.write(_TEMPLATE % {"level": for_level})
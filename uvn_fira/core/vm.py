@@ -39,15 +39,51 @@ In the NadiaVM, there are several commands:
 """
 from typing import Optional
 
+try:
+    from sys import intern as _intern
+except ImportError:
+    _intern = intern   #pylint:disable=undefined-variable
+
+_MOVE_TRANSFORMS = {
+    "north": (-1, 0),
+    "south": (1, 0),
+    "west": (0, -1),
+    "east": (0, 1)
+}
 
 class CSNadiaVMCommandNotFoundError(Exception):
     """VM command not found."""
 
+def _array_operands(instruction):
+    # type: (list[str]) -> tuple[str, int]
+    """Get the array name and index operands of an `alloc`, `push`, or `pop` instruction.
+
+    Array names are interned so that every instruction referring to the same array shares one
+        string, which keeps array lookups to a pointer comparison.
+    """
+    return _intern(instruction[1]), int(instruction[2])
+
+def _value_operands(instruction):
+    # type: (list[str]) -> tuple[str]
+    """Get the value operand of a `set` instruction."""
+    return (instruction[2],)
+
+def _direction_operands(instruction):
+    # type: (list[str]) -> tuple[tuple[int, int]]
+    """Get the direction operand of a `move` instruction as the transform to apply to the player.
+
+    Unknown directions move the player east.
+    """
+    return (_MOVE_TRANSFORMS.get(instruction[2], _MOVE_TRANSFORMS["east"]),)
+
+def _no_operands(instruction):  #pylint:disable=unused-argument
+    # type: (list[str]) -> tuple
+    """Get the operands of an instruction that doesn't take any."""
+    return ()
+
 class CSNadiaVM(object):
     """An implementation of the NadiaVM stack."""
-
-    _instructions = []
-    _stack = []
+    __slots__ = ("_instructions", "_counter", "_stack", "_arrays", "_player_pos")
 
     def __init__(self, path, pl):
         # type: (CSNadiaVM, str, tuple[int, int]) -> None
@@ -58,7 +94,20 @@ class CSNadiaVM(object):
             pl (tuple): The coordinates of the player.
         """
         with open(path, 'r') as vm_file:
-            self._instructions = list(filter(lambda a: a, vm_file.read().split("\n")))
+            lines = [line for line in vm_file.read().splitlines() if line]
+
+        # Programs repeat the same few instructions many times over, so each distinct line only
+        # needs to be decoded once.
+        decoded = {}
+        self._instructions = []
+        for line in lines:
+            if line not in decoded:
+                decoded[line] = self._decode(line)
+            self._instructions.append(decoded[line])
+
+        self._counter = 0
+        self._stack = []
+        self._arrays = {}
         self._player_pos = pl
 
     def has_more_instructions(self):
@@ -68,7 +117,7 @@ class CSNadiaVM(object):
         Returns:
             more (bool): Boolean that will be True if there are more instructions, False otherwise.
         """
-        return len(self._instructions) > 0
+        return self._counter < len(self._instructions)
 
     def preview_next_instruction(self):
         # type: (CSNadiaVM) -> Optional[str]
@@ -79,7 +128,7 @@ class CSNadiaVM(object):
                 are no more instructions to execute in the VM.
         """
         if self.has_more_instructions():
-            return self._instructions[0].split(" ")[0]
+            return self._instructions[self._counter][0]
         else:
             return None
 
@@ -90,35 +139,53 @@ class CSNadiaVM(object):
         Raises:
             error (CSNadiaVMCommandNotFoundError): Command not found.
         """
-        current = self._instructions.pop(0).split(" ")
-
-        instruct = {
-            "alloc": self._alloc,
-            "push": self._push,
-            "pop" : self._pop,
-            "set": self._set,
-            "move": self._move,
-            "add": self._add,
-            "sub": self._sub,
-            "mult": self._mult,
-            "div": self._div,
-            "neg": self._neg,
-            "exit": "NOCOMM",
-            "collect": "NOCOMM",
-        }
-
-        if current[0] not in instruct:
-            raise CSNadiaVMCommandNotFoundError("Invalid command: '%s'" % (current[0]))
-
-        command = instruct.get(current[0])
-        if current[0] in ["alloc", "push", "pop"]:
-            command(current[1], int(current[2]))
-        elif current[0] in ["set", "move"]:
-            command(current[2])
-        elif current[0] in ["add", "sub", "mult", "div", "neg"]:
-            command()
-        else:
-            pass
+        _, command, operands = self._instructions[self._counter]
+        self._counter += 1
+        getattr(self, command)(*operands)
+
+    def _decode(self, instruction):
+        # type: (CSNadiaVM, str) -> tuple[str, str, tuple]
+        """Decode an instruction into its command name, handler, and operands.
+
+        Handlers are stored by their method name rather than as functions, so that the VM and its
+            decoded program can still be pickled on Python 2.
+
+        Errors in the instruction are raised when the instruction is executed rather than when it
+            is decoded, so that the instructions preceding it can still run.
+
+        Arguments:
+            instruction (str): The instruction to decode.
+
+        Returns:
+            decoded (tuple): A tuple containing the command name, the name of the method that
+                executes the command, and the operands to pass to it.
+        """
+        current = instruction.split(" ", 2)
+
+        if current[0] not in self._commands:
+            message = "Invalid command: '%s'" % (current[0])
+            return current[0], "_raise_error", (CSNadiaVMCommandNotFoundError, message)
+
+        command, operands = self._commands[current[0]]
+        try:
+            return current[0], command, operands(current)
+        except (IndexError, ValueError) as error:
+            return current[0], "_raise_error", (type(error), str(error))
+
+    def _raise_error(self, error_type, message):
+        # type: (CSNadiaVM, type, str) -> None
+        """Raise an error found while decoding an instruction once the VM tries to execute it.
+
+        A new error is created each time, since identical lines share their decoded instruction.
+
+        Arguments:
+            error_type (type): The type of error to raise.
+            message (str): The message of the error.
+        """
+        raise error_type(message)
+
+    def _nop(self):
+        """Do nothing. Used for commands that only act as a pause in the VM."""
 
     def _alloc(self, name, size):
         """Allocate a space of memory for a given array.
@@ -127,7 +194,7 @@ class CSNadiaVM(object):
             name (str): The name of the array to allocate space for.
             size (int): The size of the array. Defaults to 1.
         """
-        self.__dict__[name] = [None for x in range(size)]
+        self._arrays[name] = [None] * size
 
     def _set(self, value):
         """Set the top of the stack to a constant value.
@@ -144,7 +211,7 @@ class CSNadiaVM(object):
             name (str): The name of the array to push to.
             index (int): The index of the array to push to.
         """
-        self.__dict__[name][index] = self._stack.pop()
+        self._arrays[name][index] = self._stack.pop()
 
     def _pop(self, name, index):
         """Pop the item from the array at a given index and set it at the top
@@ -154,23 +221,17 @@ class CSNadiaVM(object):
             array (str): The array to pop an item from.
             index (int): The index of the item in the array to pop.
         """
-        self._stack.append(self.__dict__[name][index])
-        self.__dict__[name][index] = None
+        array = self._arrays[name]
+        self._stack.append(array[index])
+        array[index] = None
 
-    def _move(self, direction):
+    def _move(self, transform):
         """Move the player in a given direction.
 
         Arguments:
-            direction (str): The direction the player will move in.
+            transform (tuple): The row and column offsets of the direction the player will move in.
         """
-        transforms = {
-            "north": (-1, 0),
-            "south": (1, 0),
-            "west": (0, -1),
-            "east": (0, 1)
-        }
-
-        trans_x, trans_y = transforms.get(direction, "east")
+        trans_x, trans_y = transform
         curr_x, curr_y = self._player_pos
         self._player_pos = curr_x + trans_x, curr_y + trans_y
 
@@ -196,28 +257,41 @@ class CSNadiaVM(object):
         """Divide the two topmost values on the stack."""
         x = self._stack.pop()
         y = self._stack.pop()
-        self._stack.append(int(x) / int(y))
+        self._stack.append(int(x) // int(y))
 
     def _neg(self):
         """Negate the topmost value on the stack.
 
         Effectively, this is the equivalent of pushing -1 onto the stack and calling mult.
         """
-        self._stack.append(-1)
-        self._mult()
+        self._stack.append(-int(self._stack.pop()))
+
+    _commands = {
+        "alloc": ("_alloc", _array_operands),
+        "push": ("_push", _array_operands),
+        "pop": ("_pop", _array_operands),
+        "set": ("_set", _value_operands),
+        "move": ("_move", _direction_operands),
+        "add": ("_add", _no_operands),
+        "sub": ("_sub", _no_operands),
+        "mult": ("_mult", _no_operands),
+        "div": ("_div", _no_operands),
+        "neg": ("_neg", _no_operands),
+        "exit": ("_nop", _no_operands),
+        "collect": ("_nop", _no_operands),
+    }
 
     def get(self, name):
         # type: (CSNadiaVM, str) -> Optional[list]
-        """Get the specified item in the virtual machine.
+        """Get the specified array in the virtual machine.
 
         Arguments:
-            name (str): The name of the item to get.
+            name (str): The name of the array to get.
 
         Returns:
-            array (list): The specified item, or None if it doesn't exist.
+            array (list): The specified array, or None if it hasn't been allocated.
         """
-        return self.__dict__[name] if name in self.__dict__ \
-            and type(self.__dict__[name]) is list else None #pylint:disable=unidiomatic-typecheck
+        return self._arrays.get(name)
 
     def pos(self):
         # type: (CSNadiaVM) -> tuple[int, int]
@@ -228,57 +302,60 @@ class CSNadiaVM(object):
         """
         return self._player_pos
 
-class CSNadiaVMWriterBuilder(object):
-    """An list-based implementation of the NadiaVM file writer.
-
-    This class is similar to CSNadaVMWriter and contains the same methods; however,
-        CSNadiaVMWriterBuilder uses a list to store its code rather the string that CSNadiaVMWriter
-        uses. This is useful in instances where the builder needs to remove pieces of code or work
-        with the current set of instructions as a list.
+class CSNadiaVMWriter(object):
+    """An implementation of the NadiaVM file writer.
 
     Attributes:
-        instructions (list): The list of VM commands to write to the VM file.
+        code (str): The VM code to write to the VM file.
     """
-
-    instructions = []
+    __slots__ = ("path", "_code")
 
     def __init__(self, path):
-        # type: (CSNadiaVMWriterBuilder, str) -> None
-        """Construct the VM writer builder.
+        # type: (CSNadiaVMWriter, str) -> None
+        """Construct the VM writer.
 
         Arguments:
             path (str): The path to the compiled NadiaVM file (`.nvm`) to write to.
         """
         self.path = path
+        self._code = []
 
     def __str__(self):
-        string = "Filepath: %s\n" % (self.path)
-        for instruction in self.instructions:
-            string += "%s\n" % (instruction)
-        return string
+        return "Filepath: " + self.path + "\n" + self.code
+
+    @property
+    def code(self):
+        # type: (CSNadiaVMWriter) -> str
+        """The VM code to write to the VM file, joined from the lines written so far."""
+        return "".join(self._code)
+
+    @code.setter
+    def code(self, value):
+        # type: (CSNadiaVMWriter, str) -> None
+        self._code = [value]
 
     def alloc(self, array_name, size=1):
-        # type: (CSNadiaVMWriterBuilder, str, int) -> None
+        # type: (CSNadiaVMWriter, str, int) -> None
         """Allocate a space of memory for a given array.
 
         Arguments:
             array_name (str): The name of the array to allocate space for.
             size (int): The size of the array. Defaults to 1.
         """
-        self.instructions.append("alloc %s %s\n" % (array_name, size))
+        self._code.append("alloc %s %s\n" % (array_name, size))
 
     def push(self, array, index):
-        # type: (CSNadiaVMWriterBuilder, str, int) -> None
+        # type: (CSNadiaVMWriter, str, int) -> None
         """Push the top-most item on the current stack to the given array.
 
         Arguments:
             array (str): The name of the array to push to.
             index (int): The index of the array to push to.
         """
-        self.instructions.append("push %s %s\n" % (array, index))
+        self._code.append("push %s %s\n" % (array, index))
 
     def pop(self, array, index):
-        # type: (CSNadiaVMWriterBuilder, str, int) -> None
+        # type: (CSNadiaVMWriter, str, int) -> None
         """Pop the item from the array at a given index and set it at the top
         of the execution stack.
 
@@ -286,64 +363,93 @@ class CSNadiaVMWriterBuilder(object):
             array (str): The array to pop an item from.
             index (int): The index of the item in the array to pop.
         """
-        self.instructions.append("pop %s %s\n" % (array, index))
+        self._code.append("pop %s %s\n" % (array, index))
 
     def set(self, value):
-        # type: (CSNadiaVMWriterBuilder, any) -> None
+        # type: (CSNadiaVMWriter, any) -> None
         """Set the top of the stack to a constant value.
 
         Arguments:
             value (any): The value to create a constant for.
         """
-        self.instructions.append("set constant " + str(value) + "\n")
+        self._code.append("set constant " + str(value) + "\n")
 
     def move(self, direction):
-        # type: (CSNadiaVMWriterBuilder, str) -> None
+        # type: (CSNadiaVMWriter, str) -> None
         """Move the player in a given direction.
 
         Arguments:
             direction (str): The direction the player will move in.
         """
-        self.instructions.append("move player " + direction + "\n")
+        self._code.append("move player " + direction + "\n")
 
     def collect(self):
-        # type: (CSNadiaVMWriterBuilder) -> None
-        """Collect. In the VM, this acts like a pause."""
-        self.instructions.append("collect\n")
+        # type: (CSNadiaVMWriter) -> None
+        """Collect. In the VM, this can act like a pause."""
+        self._code.append("collect\n")
 
     def exit(self):
-        # type: (CSNadiaVMWriterBuilder) -> None
+        # type: (CSNadiaVMWriter) -> None
         """Try to exit the world and end execution of the script."""
-        self.instructions.append("exit player\n")
+        self._code.append("exit player\n")
 
     def add(self):
         """Add the two topmost values on the stack."""
-        self.instructions.append("add\n")
+        self._code.append("add\n")
 
     def sub(self):
         """Subtract the two topmost values on the stack."""
-        self.instructions.append("sub\n")
+        self._code.append("sub\n")
 
     def mult(self):
         """Multiply the two topmost values on the stack."""
-        self.instructions.append("mult\n")
+        self._code.append("mult\n")
 
     def div(self):
         """Divide the two topmost values on the stack."""
-        self.instructions.append("div\n")
+        self._code.append("div\n")
 
     def neg(self):
         """Negate the topmost value on the stack.
 
         Effectively, this is the equivalent of pushing -1 onto the stack and calling mult.
         """
-        self.instructions.append("neg\n")
+        self._code.append("neg\n")
 
     def write(self):
-        # type: (CSNadiaVMWriterBuilder) -> None
+        # type: (CSNadiaVMWriter) -> None
         """Write the VM code to the requested file."""
-        with open(self.path, 'w+') as vm_file_stream:
-            vm_file_stream.write("".join(self.instructions))
+        with open(self.path, 'w') as vm_file_stream:
+            vm_file_stream.write(self.code)
+
+
+class CSNadiaVMWriterBuilder(CSNadiaVMWriter):
+    """An list-based implementation of the NadiaVM file writer.
+
+    This class is similar to CSNadaVMWriter and contains the same methods; however,
+        CSNadiaVMWriterBuilder exposes its code as a list of instructions rather than the string
+        that CSNadiaVMWriter uses. This is useful in instances where the builder needs to remove
+        pieces of code or work with the current set of instructions as a list.
+
+    Attributes:
+        instructions (list): The list of VM commands to write to the VM file.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        return "Filepath: %s\n" % (self.path) \
+            + "".join("%s\n" % (instruction) for instruction in self.instructions)
+
+    @property
+    def instructions(self):
+        # type: (CSNadiaVMWriterBuilder) -> list[str]
+        """The list of VM commands to write to the VM file."""
+        return self._code
+
+    @instructions.setter
+    def instructions(self, value):
+        # type: (CSNadiaVMWriterBuilder, list[str]) -> None
+        self._code = value
 
     def clear(self):
         # type: (CSNadiaVMWriterBuilder) -> None
@@ -361,111 +467,6 @@ class CSNadiaVMWriterBuilder(object):
         if len(self.instructions) > 0:
             instruction = self.instructions.pop()
 
-            if instruction == "collect" and not ignore_collect:
+            if instruction == "collect\n" and not ignore_collect:
                 self.instructions.pop()     # Pops the push statement.
                 self.instructions.pop()     # Pops the pop statement.
-
-class CSNadiaVMWriter(object):
-    """An implementation of the NadiaVM file writer."""
-
-    code = """"""
-
-    def __init__(self, path):
-        # type: (CSNadiaVMWriter, str) -> None
-        """Construct the VM writer.
-
-        Arguments:
-            path (str): The path to the compiled NadiaVM file (`.nvm`) to write to.
-        """
-        self.path = path
-
-    def __str__(self):
-        return "Filepath: " + self.path + "\n" + self.code
-
-    def alloc(self, array_name, size=1):
-        # type: (CSNadiaVMWriter, str, int) -> None
-        """Allocate a space of memory for a given array.
-
-        Arguments:
-            array_name (str): The name of the array to allocate space for.
-            size (int): The size of the array. Defaults to 1.
-        """
-        self.code += "alloc %s %s\n" % (array_name, size)
-
-    def push(self, array, index):
-        # type: (CSNadiaVMWriter, str, int) -> None
-        """Push the top-most item on the current stack to the given array.
-
-        Arguments:
-            array (str): The name of the array to push to.
-            index (int): The index of the array to push to.
-        """
-        self.code += "push %s %s\n" % (array, index)
-
-    def pop(self, array, index):
-        # type: (CSNadiaVMWriter, str, int) -> None
-        """Pop the item from the array at a given index and set it at the top
-        of the execution stack.
-
-        Arguments:
-            array (str): The array to pop an item from.
-            index (int): The index of the item in the array to pop.
-        """
-        self.code += "pop %s %s\n" % (array, index)
-
-    def set(self, value):
-        # type: (CSNadiaVMWriter, any) -> None
-        """Set the top of the stack to a constant value.
-
-        Arguments:
-            value (any): The value to create a constant for.
-        """
-        self.code += "set constant " + str(value) + "\n"
-
-    def move(self, direction):
-        # type: (CSNadiaVMWriter, str) -> None
-        """Move the player in a given direction.
-
-        Arguments:
-            direction (str): The direction the player will move in.
-        """
-        self.code += "move player " + direction + "\n"
-
-    def collect(self):
-        # type: (CSNadiaVMWriter) -> None
-        """Collect. In the VM, this can act like a pause."""
-        self.code += "collect\n"
-
-    def exit(self):
-        # type: (CSNadiaVMWriter) -> None
-        """Try to exit the world and end execution of the script."""
-        self.code += "exit player\n"
-
-    def add(self):
-        """Add the two topmost values on the stack."""
-        self.code += "add\n"
-
-    def sub(self):
-        """Subtract the two topmost values on the stack."""
-        self.code += "sub\n"
-
-    def mult(self):
-        """Multiply the two topmost values on the stack."""
-        self.code += "mult\n"
-
-    def div(self):
-        """Divide the two topmost values on the stack."""
-        self.code += "div\n"
-
-    def neg(self):
-        """Negate the topmost value on the stack.
-
-        Effectively, this is the equivalent of pushing -1 onto the stack and calling mult.
-        """
-        self.code += "neg\n"
-
-    def write(self):
-        # type: (CSNadiaVMWriter) -> None
-        """Write the VM code to the requested file."""
-        with open(self.path, 'w+') as vm_file_stream:
-            vm_file_stream.write(self.code)